@@ -8,6 +8,34 @@ st_autorefresh(interval=5 * 60 * 1000, key="refresh")
 from data_loader import fetch_ohlc_yahoo
 from strategies import buy_and_hold, moving_average_crossover
 from metrics import compute_performance_metrics
+from charts import downsample
+
+
+INTERVALS = ["1d", "1h"]
+PERIODS_PER_YEAR = {
+    "1d": 252,
+    "1h": 1638, #6,5h*252
+}
+STRATEGIES = ["Buy & Hold", "MA Crossover"]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_ohlc(
+    symbol,
+    start_date,
+    end_date,
+    interval,
+):
+    """
+    Load and cache OHLC data for 5 minutes to avoid
+    unnecessary API calls during auto-refresh.
+    """
+    return fetch_ohlc_yahoo(
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        interval=interval,
+    )
 
 
 # Streamlit page config
@@ -43,18 +71,14 @@ if start_date >= end_date:
 
 interval = st.sidebar.selectbox(
     "Interval (periodicity)",
-    ["1d", "1h"],
+    INTERVALS,
     index=0
 )
-periods_map = {
-    "1d": 252,
-    "1h": 1638, #6,5h*252  
-}
-periods_per_year = periods_map[interval]
+periods_per_year = PERIODS_PER_YEAR[interval]
 
 strategy_choice = st.sidebar.selectbox(
     "Strategy",
-    ["Buy & Hold", "MA Crossover"]
+    STRATEGIES
 )
 
 short_window = st.sidebar.slider("Short MA window", 5, 50, 20)
@@ -72,7 +96,7 @@ if run:
             st.warning("Hourly data is limited by Yahoo (~2 years). Date range adjusted.")
             start_date = end_date - dt.timedelta(days=700)
 
-        df = fetch_ohlc_yahoo(
+        df = load_ohlc(
             symbol=symbol,
             start_date=start_date.isoformat(),
             end_date=end_date.isoformat(),
@@ -112,7 +136,7 @@ if run:
                 },
                 index=close.index
             )
-            st.line_chart(combined)
+            st.line_chart(downsample(combined))
 
             st.subheader("Performance Metrics")
             st.json(metrics_dict)
@@ -135,7 +159,7 @@ if run:
                 },
                 index=close.index
             )
-            st.line_chart(combined)
+            st.line_chart(downsample(combined))
 
             st.subheader("Performance Metrics")
             st.json(metrics_dict)
@@ -2,7 +2,7 @@ import datetime as dt
 import pandas as pd
 import streamlit as st
 
-from data_loader import fetch_ohlc_yahoo
+from data_loader import fetch_ohlc_yahoo, fetch_ohlc_yahoo_multi
 from strategies_portfolio import (
     build_price_panel,
     parse_weights,
@@ -12,20 +12,18 @@ from metrics_portfolio import (
     compute_portfolio_metrics,
     correlation_matrix,
 )
+from charts import downsample
 from streamlit_autorefresh import st_autorefresh
 
+INTERVALS = ["1d", "1h"]
+WEIGHTS_MODES = ["Equal weight", "Custom weights"]
+REBALANCE_OPTIONS = ["None", "Daily", "Weekly", "Monthly"]
+
 def _clean_tickers(s: str) -> list[str]:
-    tickers = [t.strip() for t in s.split(",") if t.strip()]
     # remove duplicates while preserving order
-    seen = set()
-    out = []
-    for t in tickers:
-        if t not in seen:
-            out.append(t)
-            seen.add(t)
-    return out
-
-@st.cache_data(ttl=300)
+    return list(dict.fromkeys(t.strip() for t in s.split(",") if t.strip()))
+
+@st.cache_resource(ttl=300)
 def load_prices(
     tickers,
     start_date,
@@ -35,6 +33,9 @@ def load_prices(
     """
     Load and cache multi-asset price data for 5 minutes to avoid
     unnecessary API calls during auto-refresh.
+
+    The cached DataFrame is returned by reference (no pickle/copy on each
+    cache hit): callers must treat it as read-only.
     """
     return build_price_panel(
         tickers=tickers,
@@ -42,6 +43,7 @@ def load_prices(
         end_date=end_date,
         interval=interval,
         fetcher=fetch_ohlc_yahoo,
+        multi_fetcher=fetch_ohlc_yahoo_multi,
     )
 
 st.set_page_config(page_title="Quant B – Multi-Asset Portfolio", layout="wide")
@@ -73,30 +75,31 @@ end_date = st.sidebar.date_input("End date", value=today)
 
 interval = st.sidebar.selectbox(
     "Interval (periodicity)",
-    ["1d", "1h"],
+    INTERVALS,
     index=0
 )
 
-weights_mode = st.sidebar.selectbox("Weights mode", ["Equal weight", "Custom weights"])
+weights_mode = st.sidebar.selectbox("Weights mode", WEIGHTS_MODES)
 
 custom_weights = {}
 
 if weights_mode == "Custom weights":
     st.sidebar.markdown("### Portfolio Weights")
 
-    for t in _clean_tickers(tickers_raw):
+    sidebar_tickers = _clean_tickers(tickers_raw)
+    for t in sidebar_tickers:
         custom_weights[t] = st.sidebar.slider(
             f"{t} weight",
             min_value=0.0,
             max_value=1.0,
-            value=1.0 / len(_clean_tickers(tickers_raw)),
+            value=1.0 / len(sidebar_tickers),
             step=0.05,
         )
 
 
 rebalance = st.sidebar.selectbox(
     "Rebalancing frequency",
-    ["None", "Daily", "Weekly", "Monthly"],
+    REBALANCE_OPTIONS,
     index=2
 )
 
@@ -187,7 +190,7 @@ if run:
 
         combined = norm_assets.copy()
         combined["PORTFOLIO"] = norm_equity
-        st.line_chart(combined)
+        st.line_chart(downsample(combined))
 
         # Correlation matrix
         st.subheader("Correlation Matrix (returns)")
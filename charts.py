@@ -0,0 +1,19 @@
+import pandas as pd
+
+
+MAX_CHART_POINTS = 2000  # rows sent to the browser per chart
+
+
+def downsample(df: pd.DataFrame, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """
+    Keep every n-th row (plus the last one) so that at most ~max_points rows
+    are serialized to the browser by st.line_chart.
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+    step = -(-n // max_points)  # ceil division
+    pos = list(range(0, n, step))
+    if pos[-1] != n - 1:
+        pos.append(n - 1)
+    return df.iloc[pos]
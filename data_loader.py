@@ -1,5 +1,136 @@
+import hashlib
+import os
+import re
+import threading
+import time
+import uuid
+
 import pandas as pd
 import yfinance as yf
+from curl_cffi import requests as curl_requests
+
+
+# On-disk cache shared by the dashboards and the cron report
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_TTL = 300  # seconds, matches the dashboards' auto-refresh (older files are deleted)
+
+# Characters allowed verbatim in cache file names (Yahoo tickers, dates, intervals)
+_SAFE_SYMBOL = re.compile(r"[A-Za-z0-9.=^-]+")
+_SAFE_PART = re.compile(r"[A-Za-z0-9-]+")
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    """
+    Return the HTTP session shared by every Yahoo download in this process.
+
+    Reusing one session keeps connections to Yahoo alive, so successive
+    downloads (dashboard reruns, portfolio panels, cron report) skip the
+    TCP/TLS handshake. yfinance requires a curl_cffi session.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = curl_requests.Session(impersonate="chrome")
+        return _SESSION
+
+
+def _cache_path(symbol: str, start_date: str, end_date: str, interval: str) -> str:
+    """
+    Internal helper: cache file for one download.
+
+    Tickers come from free-text inputs, so keys with any other character
+    are hashed: the file name can never leave CACHE_DIR.
+    """
+    parts = (str(interval), str(start_date), str(end_date))
+    if _SAFE_SYMBOL.fullmatch(str(symbol)) and all(_SAFE_PART.fullmatch(p) for p in parts):
+        name = f"{symbol}_{interval}_{start_date}_{end_date}"
+    else:
+        name = hashlib.sha256(repr((symbol, *parts)).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.parquet")
+
+
+def _read_cache(path: str, ttl: float):
+    """
+    Internal helper: return the cached frame if it is fresher than `ttl` seconds.
+    """
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            return pd.read_parquet(path)
+    except Exception:
+        # The cache is best-effort: a missing/corrupt file means a fresh download
+        pass
+    return None
+
+
+def _prune_cache() -> None:
+    """
+    Internal helper: delete cache files older than CACHE_TTL.
+
+    Keys include a rolling end date, so expired entries are never read
+    again and would otherwise accumulate forever.
+    """
+    now = time.time()
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and now - entry.stat().st_mtime > CACHE_TTL:
+                    os.remove(entry.path)
+            except OSError:
+                # Already removed by another process
+                pass
+
+
+def _write_cache(path: str, df: pd.DataFrame) -> None:
+    """
+    Internal helper: atomically store `df` at `path` and prune expired entries.
+
+    The dashboards' sessions and the cron report share the cache, so the
+    frame is written to a temporary file and renamed into place: readers
+    never see a partially written parquet file. The temporary file is
+    created by to_parquet (not mkstemp, which forces mode 0600) so its
+    permissions follow the umask and every user of the cache can read it.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = os.path.join(CACHE_DIR, f".{uuid.uuid4().hex}.tmp")
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _prune_cache()
+    except Exception:
+        pass
+
+
+def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Internal helper: lower-case Yahoo column names and name the index.
+
+    Single-ticker downloads come back with (Price, Ticker) columns: only
+    the field level is kept, so both fetchers cache the same flat layout.
+    """
+    df = df.rename(
+        columns={
+            "Open": "open",
+            "High": "high",
+            "Low": "low",
+            "Close": "close",
+            "Adj Close": "adj_close",
+            "Volume": "volume",
+        }
+    )
+    if isinstance(df.columns, pd.MultiIndex):
+        level = "Price" if "Price" in df.columns.names else 0
+        df.columns = df.columns.get_level_values(level)
+
+    df.index.name = "time"
+    return df
 
 
 def fetch_ohlc_yahoo(
@@ -7,6 +138,8 @@ def fetch_ohlc_yahoo(
     start_date: str,
     end_date: str,
     interval: str = "1d",
+    cache_ttl: float = CACHE_TTL,
+    session=None,
 ) -> pd.DataFrame:
     """
     Fetch OHLCV data from Yahoo Finance for a single asset.
@@ -15,7 +148,17 @@ def fetch_ohlc_yahoo(
     start_date  : 'YYYY-MM-DD'
     end_date    : 'YYYY-MM-DD'
     interval    : '1d','1h','30m','15m','5m','1m' (depends on Yahoo limits)
+    cache_ttl   : seconds a parquet copy on disk is reused (0 disables the cache)
+    session     : HTTP session passed to yfinance (defaults to get_session())
     """
+    path = _cache_path(symbol, start_date, end_date, interval)
+    if cache_ttl > 0:
+        cached = _read_cache(path, cache_ttl)
+        if cached is not None:
+            return cached
+
+    if session is None:
+        session = get_session()
 
     df = yf.download(
         symbol,
@@ -24,21 +167,90 @@ def fetch_ohlc_yahoo(
         interval=interval,
         auto_adjust=False,
         progress=False,
+        session=session,
     )
 
     if df.empty:
         return df  
 
-    df = df.rename(
-        columns={
-            "Open": "open",
-            "High": "high",
-            "Low": "low",
-            "Close": "close",
-            "Adj Close": "adj_close",
-            "Volume": "volume",
-        }
-    )
+    df = _normalize_columns(df)
 
-    df.index.name = "time"
+    if cache_ttl > 0:
+        _write_cache(path, df)
     return df
+
+
+def fetch_ohlc_yahoo_multi(
+    symbols: list[str],
+    start_date: str,
+    end_date: str,
+    interval: str = "1d",
+    cache_ttl: float = CACHE_TTL,
+    session=None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Fetch OHLCV data from Yahoo Finance for several assets in a single request.
+
+    Symbols still fresh in the on-disk cache are not downloaded again;
+    `session` defaults to get_session().
+    Returns a dict {symbol: DataFrame} with the same columns as
+    fetch_ohlc_yahoo. Symbols without data are left out.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    missing: list[str] = []
+
+    for symbol in symbols:
+        cached = None
+        if cache_ttl > 0:
+            cached = _read_cache(_cache_path(symbol, start_date, end_date, interval), cache_ttl)
+        if cached is not None:
+            frames[symbol] = cached
+        else:
+            missing.append(symbol)
+
+    if missing:
+        if session is None:
+            session = get_session()
+        raw = yf.download(
+            " ".join(missing),
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            auto_adjust=False,
+            progress=False,
+            group_by="ticker",
+            threads=True,
+            session=session,
+        )
+
+        # yfinance upper-cases tickers: match them case-insensitively and
+        # keep the caller's spelling as the key
+        downloaded = {}
+        if isinstance(raw.columns, pd.MultiIndex):
+            downloaded = {str(t).upper(): t for t in raw.columns.get_level_values(0)}
+
+        for symbol in missing:
+            if raw.empty:
+                break
+            if isinstance(raw.columns, pd.MultiIndex):
+                ticker = downloaded.get(symbol.upper())
+                if ticker is None:
+                    continue
+                df = raw[ticker]
+            elif len(missing) == 1:
+                df = raw
+            else:
+                continue
+
+            # The combined frame is indexed on the union of all timestamps
+            df = df.dropna(how="all")
+            if df.empty:
+                continue
+
+            df = _normalize_columns(df)
+            if cache_ttl > 0:
+                path = _cache_path(symbol, start_date, end_date, interval)
+                _write_cache(path, df)
+            frames[symbol] = df
+
+    return {s: frames[s] for s in symbols if s in frames}
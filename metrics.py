@@ -8,21 +8,36 @@ def compute_performance_metrics(equity_curve: pd.Series,
 
     if isinstance(equity_curve, pd.DataFrame):
         equity_curve = equity_curve.iloc[:, 0]
-    equity_curve = pd.Series(equity_curve).dropna()
+    arr = np.ascontiguousarray(pd.Series(equity_curve).to_numpy(dtype=np.float64))
+    arr = arr[~np.isnan(arr)]
 
-    returns = equity_curve.pct_change().dropna()
-    if returns.empty:
+    if len(arr) < 2:
         return {}
+    if (arr > 0).all():
+        # log-returns computed once; compounding becomes a sum
+        log_returns = np.diff(np.log(arr))
+        log_total = log_returns.sum()
+        n = len(log_returns)
+
+        total_return = np.expm1(log_total)
+        ann_return = np.expm1(log_total * periods_per_year / n)
+        # volatility is reported on arithmetic returns
+        returns = np.expm1(log_returns)
+    else:
+        # log is undefined for equity <= 0 (e.g. a short through a >100% move)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = arr[1:] / arr[:-1] - 1
+            total_return = arr[-1] / arr[0] - 1
+            n = len(returns)
+            ann_return = (1 + total_return) ** (periods_per_year / n) - 1
+
+    with np.errstate(invalid="ignore"):
+        ann_vol = float(returns.std(ddof=1) * np.sqrt(periods_per_year)) if n > 1 else np.nan
 
-    total_return = equity_curve.iloc[-1] / equity_curve.iloc[0] - 1
-    n = len(returns)
-    ann_return = (1 + total_return) ** (periods_per_year / n) - 1
-
-    ann_vol = float(returns.std() * np.sqrt(periods_per_year))
     sharpe = (float(ann_return) - risk_free_rate) / ann_vol if ann_vol != 0 else np.nan
 
-    running_max = equity_curve.cummax()
-    drawdown = equity_curve / running_max - 1
+    running_max = np.maximum.accumulate(arr)
+    drawdown = arr / running_max - 1
     max_dd = float(drawdown.min())
 
     return {
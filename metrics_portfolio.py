@@ -34,9 +34,9 @@ def compute_portfolio_metrics(
     ann_vol = float(returns.std() * np.sqrt(periods_per_year))
     sharpe = (float(ann_return) - risk_free_rate) / ann_vol if ann_vol != 0 else np.nan
 
-    running_max = equity_curve.cummax()
-    drawdown = equity_curve / running_max - 1
-    max_dd = float(drawdown.min())
+    arr = equity_curve.to_numpy(dtype=np.float64)
+    running_max = np.maximum.accumulate(arr)
+    max_dd = float((arr / running_max - 1).min())
 
     return {
         "Total return": float(total_return),
@@ -6,13 +6,13 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-import json
 import datetime as dt
 
 import numpy as np
+import orjson
 import pandas as pd
 
-from data_loader import fetch_ohlc_yahoo
+from data_loader import fetch_ohlc_yahoo_multi
 
 
 # Configuration
@@ -38,27 +38,35 @@ def compute_daily_metrics(df: pd.DataFrame) -> dict:
     - daily volatility (abs return)
     - max drawdown over lookback period
     """
-    close = df["close"].dropna()
-    open_series = df["open"].dropna()
+    close = df["close"]
+    open_series = df["open"]
+    # Single-ticker downloads may come back with one column per ticker
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    if isinstance(open_series, pd.DataFrame):
+        open_series = open_series.iloc[:, 0]
+    close = close.dropna()
+    open_series = open_series.dropna()
 
     if close.empty or open_series.empty:
         return {"error": "Not enough data"}
-    
-    open_price = float(open_series.iloc[-1].item())
-    close_price = float(close.iloc[-1].item())
+
+    # numpy scalars are serialized as-is by orjson
+    open_price = open_series.iloc[-1]
+    close_price = close.iloc[-1]
 
     returns = close.pct_change().dropna()
-    daily_vol = float(abs(returns.iloc[-1].item())) if not returns.empty else 0.0
+    daily_vol = abs(returns.iloc[-1]) if not returns.empty else 0.0
 
-    running_max = close.cummax()
-    drawdown = close / running_max - 1
-    max_dd =  float(drawdown.min().item())
+    arr = close.to_numpy(dtype=np.float64)
+    running_max = np.maximum.accumulate(arr)
+    max_dd = (arr / running_max - 1).min()
 
     return {
-        "open": float(open_price),
-        "close": float(close_price),
-        "daily_volatility": float(daily_vol),
-        "max_drawdown": float(max_dd),
+        "open": open_price,
+        "close": close_price,
+        "daily_volatility": daily_vol,
+        "max_drawdown": max_dd,
     }
 
 
@@ -73,15 +81,17 @@ def main() -> None:
         "assets": {},
     }
 
+    # One request for all tickers; yfinance downloads them on parallel threads
+    dfs = fetch_ohlc_yahoo_multi(
+        symbols=TICKERS,
+        start_date=start_date.isoformat(),
+        end_date=today.isoformat(),
+        interval=INTERVAL,
+    )
+
     for ticker in TICKERS:
-        df = fetch_ohlc_yahoo(
-            symbol=ticker,
-            start_date=start_date.isoformat(),
-            end_date=today.isoformat(),
-            interval=INTERVAL,
-        )
-
-        if df.empty:
+        df = dfs.get(ticker)
+        if df is None or df.empty:
             report["assets"][ticker] = {"error": "No data returned"}
             continue
 
@@ -92,8 +102,8 @@ def main() -> None:
     filename = f"{today.isoformat()}_report.json"
     path = os.path.join(REPORTS_DIR, filename)
 
-    with open(path, "w") as f:
-        json.dump(report, f, indent=4)
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     print(f"[OK] Daily report written to {path}")
 
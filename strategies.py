@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from numba import njit, types
 
 
 def buy_and_hold(prices: pd.Series, initial_capital: float = 1000.0) -> pd.Series:
@@ -14,29 +15,119 @@ def buy_and_hold(prices: pd.Series, initial_capital: float = 1000.0) -> pd.Serie
     return equity
 
 
+# Explicit signatures: compiled eagerly at import and cached on disk.
+# A read-only array type also accepts writable arrays.
+_PRICE_F8 = types.Array(types.float64, 1, "A", readonly=True)
+
+
+@njit([(_PRICE_F8, types.int64)], cache=True)
+def _rolling_mean(price, win):
+    """
+    Internal helper: rolling mean matching pandas' rolling(win).mean().
+
+    Same algorithm as pandas: Kahan-compensated running sum, and the exact
+    repeated value once a run of equal prices covers the whole window (a
+    plain running sum leaves ~1e-14 residue on flat stretches).
+    """
+    n = len(price)
+    out = np.full(n, np.nan)
+    sum_x = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    nobs = 0
+    neg_ct = 0
+    same_ct = 0
+    prev = price[0] if n else np.nan
+
+    for i in range(n):
+        if i >= win:
+            val = price[i - win]
+            nobs -= 1
+            y = -val - comp_remove
+            t = sum_x + y
+            comp_remove = t - sum_x - y
+            sum_x = t
+            if val < 0:
+                neg_ct -= 1
+
+        val = price[i]
+        nobs += 1
+        y = val - comp_add
+        t = sum_x + y
+        comp_add = t - sum_x - y
+        sum_x = t
+        if val < 0:
+            neg_ct += 1
+        if val == prev:
+            same_ct += 1
+        else:
+            same_ct = 1
+        prev = val
+
+        if nobs >= win:
+            result = sum_x / nobs
+            if same_ct >= nobs:
+                result = prev
+            elif neg_ct == 0 and result < 0:
+                result = 0.0
+            elif neg_ct == nobs and result > 0:
+                result = 0.0
+            out[i] = result
+
+    return out
+
+
+@njit([(_PRICE_F8, types.int64, types.int64)], cache=True)
+def _ma_cross(price, s_win, l_win):
+    """
+    Internal helper: MA crossover signal, position and returns in one pass.
+    """
+    n = len(price)
+    ma_short = _rolling_mean(price, s_win)
+    ma_long = _rolling_mean(price, l_win)
+    signal = np.zeros(n, dtype=np.int64)
+    position = np.zeros(n)
+    returns = np.zeros(n)
+    strat_ret = np.zeros(n)
+
+    for i in range(n):
+        # trading signal: 1 long, -1 short, 0 flat (NaN compares False -> 0)
+        d = ma_short[i] - ma_long[i]
+        signal[i] = (d > 0) - (d < 0)
+
+        if i > 0:
+            # use yesterday's signal
+            position[i] = signal[i - 1]
+            returns[i] = price[i] / price[i - 1] - 1.0
+            strat_ret[i] = position[i] * returns[i]
+
+    return ma_short, ma_long, signal, position, returns, strat_ret
+
+
 def moving_average_crossover(prices: pd.Series, short_window: int = 20, long_window: int = 50,
                              initial_capital: float = 1000.0):
 
     if isinstance(prices, pd.DataFrame):
         prices = prices.iloc[:, 0]
     prices = pd.Series(prices).dropna()
-    df = pd.DataFrame({"price": prices})
-    df["ma_short"] = df["price"].rolling(short_window).mean()
-    df["ma_long"] = df["price"].rolling(long_window).mean()
-
-    # trading signal: 1 long, -1 short, 0 flat
-    df["signal"] = 0
-    df.loc[df["ma_short"] > df["ma_long"], "signal"] = 1
-    df.loc[df["ma_short"] < df["ma_long"], "signal"] = -1
-
-    # use yesterday's signal
-    df["position"] = df["signal"].shift(1).fillna(0)
 
-    # returns of the asset
-    df["returns"] = df["price"].pct_change().fillna(0.0)
+    price = prices.to_numpy(dtype=np.float64)
+    ma_short, ma_long, signal, position, returns, strat_ret = _ma_cross(
+        price, int(short_window), int(long_window)
+    )
 
-    # strategy returns
-    df["strategy_returns"] = df["position"] * df["returns"]
+    df = pd.DataFrame(
+        {
+            "price": prices,
+            "ma_short": ma_short,
+            "ma_long": ma_long,
+            "signal": signal,
+            "position": position,
+            "returns": returns,
+            "strategy_returns": strat_ret,
+        },
+        index=prices.index,
+    )
 
     # equity curve
     equity_curve = (1 + df["strategy_returns"]).cumprod() * initial_capital
@@ -4,6 +4,7 @@ from typing import Callable, Dict, Tuple
 
 import numpy as np
 import pandas as pd
+from numba import njit, types
 
 
 def build_price_panel(
@@ -12,6 +13,7 @@ def build_price_panel(
     end_date: str,
     interval: str,
     fetcher: Callable[..., pd.DataFrame],
+    multi_fetcher: Callable[..., Dict[str, pd.DataFrame]] | None = None,
 ):
     """
     Download and align close prices for multiple assets.
@@ -26,6 +28,11 @@ def build_price_panel(
         Yahoo interval.
     fetcher : callable
         Function like fetch_ohlc_yahoo(symbol, start_date, end_date, interval) -> DataFrame.
+    multi_fetcher : callable, optional
+        Function like fetch_ohlc_yahoo_multi(symbols, start_date, end_date, interval)
+        -> dict[str, DataFrame], used to download all tickers in one request.
+        Tickers it does not return (or all of them, if it fails) are fetched
+        one by one with `fetcher`.
 
     Returns
     -------
@@ -36,8 +43,19 @@ def build_price_panel(
     """
     series_list: list[pd.Series] = []
 
+    frames: Dict[str, pd.DataFrame] = {}
+    if multi_fetcher is not None:
+        try:
+            frames = multi_fetcher(
+                symbols=tickers, start_date=start_date, end_date=end_date, interval=interval
+            )
+        except Exception:
+            frames = {}
+
     for t in tickers:
-        df = fetcher(symbol=t, start_date=start_date, end_date=end_date, interval=interval)
+        df = frames.get(t)
+        if df is None:
+            df = fetcher(symbol=t, start_date=start_date, end_date=end_date, interval=interval)
         if df is None or df.empty or "close" not in df.columns:
             continue
 
@@ -53,13 +71,24 @@ def build_price_panel(
     if not series_list:
         return pd.DataFrame()
 
-    prices = pd.concat(series_list, axis=1).sort_index()
-    # Intraday timestamps are not perfectly aligned across assets
+    # Intraday timestamps are not perfectly aligned across assets:
+    # forward-fill on the union of timestamps before keeping complete rows
     if interval != "1d":
-        prices = prices.ffill()
+        prices = pd.concat(series_list, axis=1).sort_index().ffill()
+        return prices.dropna(how="any")
+
+    # Daily bars: keep the common intersection directly, without building
+    # the NaN-filled union frame first
+    idx = series_list[0].index
+    for s in series_list[1:]:
+        idx = idx.intersection(s.index)
+    idx = idx.sort_values()
+
+    out = np.empty((len(idx), len(series_list)))
+    for k, s in enumerate(series_list):
+        out[:, k] = s.reindex(idx).to_numpy()
 
-    prices = prices.dropna(how="any")  # common intersection
-    return prices
+    return pd.DataFrame(out, index=idx, columns=[s.name for s in series_list])
 
 
 def parse_weights(
@@ -83,16 +112,13 @@ def parse_weights(
     """
     w: Dict[str, float] = {t: 0.0 for t in tickers}
 
-    if weights_raw.strip():
-        parts = [p.strip() for p in weights_raw.split(",") if p.strip()]
-        for p in parts:
-            if ":" not in p:
-                continue
-            k, v = p.split(":", 1)
-            k = k.strip()
-            v = v.strip()
-            if k in w:
-                w[k] = float(v)
+    for p in weights_raw.split(","):
+        k, sep, v = p.partition(":")
+        if not sep:
+            continue
+        k = k.strip()
+        if k in w:
+            w[k] = float(v)  # float() ignores surrounding whitespace
 
     if long_only and any(val < 0 for val in w.values()):
         raise ValueError("Negative weights detected. This portfolio is long-only by default.")
@@ -104,22 +130,80 @@ def parse_weights(
     return {k: v / s for k, v in w.items()}
 
 
-def _rebalance_dates(index: pd.DatetimeIndex, rebalance: str):
+def _rebalance_mask(index: pd.DatetimeIndex, rebalance: str) -> np.ndarray:
     """
-    Internal helper: compute rebalancing timestamps from index.
+    Internal helper: boolean mask of rebalancing timestamps in index.
+
+    The first timestamp is always a rebalance (initial allocation).
     """
+    n = len(index)
     if rebalance == "None":
-        return pd.DatetimeIndex([index[0]])
-    if rebalance == "Daily":
-        return index
-    if rebalance == "Weekly":
+        mask = np.zeros(n, dtype=bool)
+    elif rebalance == "Daily":
+        mask = np.ones(n, dtype=bool)
+    elif rebalance == "Weekly":
         # Mondays in the available index
-        return index[index.to_series().dt.weekday == 0]
-    if rebalance == "Monthly":
-        s = index.to_series()
-        first = s.groupby([s.dt.year, s.dt.month]).head(1).index
-    	return index[index.isin(first)]
-    raise ValueError(f"Unknown rebalance frequency: {rebalance}")
+        mask = np.asarray(index.weekday == 0)
+    elif rebalance == "Monthly":
+        # First timestamp of each (year, month)
+        ym = np.asarray(index.year * 12 + index.month)
+        mask = np.empty(n, dtype=bool)
+        mask[1:] = ym[1:] != ym[:-1]
+    else:
+        raise ValueError(f"Unknown rebalance frequency: {rebalance}")
+
+    if n:
+        mask[0] = True
+    return mask
+
+
+# Read-only, any-layout array types: they also accept writable arrays, and
+# pandas may hand out read-only views from to_numpy().
+_PX_F8 = types.Array(types.float64, 2, "A", readonly=True)
+_PX_F4 = types.Array(types.float32, 2, "A", readonly=True)
+_MASK = types.Array(types.boolean, 1, "A", readonly=True)
+_VEC_F8 = types.Array(types.float64, 1, "A", readonly=True)
+
+
+# Explicit signatures compile eagerly at import (and are cached on disk),
+# so the first backtest of a Streamlit session does not pay the JIT cost.
+@njit(
+    [
+        (_PX_F8, _MASK, _VEC_F8, types.float64),
+        (_PX_F4, _MASK, _VEC_F8, types.float64),
+    ],
+    cache=True,
+    fastmath=True,
+)
+def _simulate_kernel(px, rebal_mask, w, init_cap):
+    """
+    Internal helper: compiled simulation loop.
+
+    Returns the portfolio equity (n,) and per-asset values (n, k).
+    `px` may be float32 (half the memory traffic); values and equity are
+    always computed and returned in float64.
+    """
+    n, k = px.shape
+    values = np.empty((n, k))
+    equity = np.empty(n)
+    shares = np.zeros(k)
+    cur = init_cap
+
+    for i in range(n):
+        if rebal_mask[i]:
+            for j in range(k):
+                shares[j] = cur * w[j] / px[i, j]
+
+        total = 0.0
+        for j in range(k):
+            v = shares[j] * px[i, j]
+            values[i, j] = v
+            total += v
+
+        cur = total
+        equity[i] = cur
+
+    return equity, values
 
 
 def simulate_portfolio_rebalanced(
@@ -157,7 +241,12 @@ def simulate_portfolio_rebalanced(
     if prices is None or prices.empty:
         return pd.Series(dtype=float), pd.DataFrame()
 
-    prices = prices.copy().dropna(how="any").sort_index()
+    # Prices are only read below: skip the defensive copy and only clean/sort
+    # when needed (panels from build_price_panel already are)
+    if prices.isna().to_numpy().any():
+        prices = prices.dropna(how="any")
+    if not prices.index.is_monotonic_increasing:
+        prices = prices.sort_index()
     tickers = list(prices.columns)
 
     # Normalize provided weights to the available tickers
@@ -167,41 +256,35 @@ def simulate_portfolio_rebalanced(
         raise ValueError("Provided weights sum to 0 for the available tickers.")
     w = {k: v / s for k, v in w.items()}
 
-    rebal = set(_rebalance_dates(prices.index, rebalance))
-
-    shares = pd.Series(0.0, index=tickers)
-    current_value = float(initial_capital)
-
-    equity_list: list[float] = []
-    weights_list: list[pd.Series] = []
-    values_list: list[pd.Series] = []
-
-    for i, ts in enumerate(prices.index):
-        px = prices.loc[ts]
-
-        # Rebalance on first timestamp and whenever scheduled
-        if i == 0 or ts in rebal:
-            target_values = pd.Series({t: current_value * w[t] for t in tickers})
-            shares = target_values / px
-
-        values = shares * px
-        current_value = float(values.sum())
-
-        realized_w = (values / values.sum()).replace([np.inf, -np.inf], np.nan).fillna(0.0)
-
-        equity_list.append(current_value)
-        weights_list.append(realized_w)
-        values_list.append(values)
-
-    equity = pd.Series(equity_list, index=prices.index, name="Portfolio Equity")
-
-    weights_df = pd.DataFrame(weights_list, index=prices.index)
-    weights_df.columns = [f"w_{c}" for c in weights_df.columns]
-
-    values_df = pd.DataFrame(values_list, index=prices.index)
-    values_df.columns = [f"val_{c}" for c in values_df.columns]
-
-    details = pd.concat([prices, weights_df, values_df], axis=1)
-    details["portfolio_return"] = equity.pct_change().fillna(0.0)
+    px = prices.to_numpy(dtype=np.float64)
+    # float32 is only used for the kernel input: displayed prices stay float64
+    px_kernel = np.ascontiguousarray(px, dtype=np.float32)
+    w_vec = np.array([w[t] for t in tickers], dtype=np.float64)
+
+    # Rebalance on first timestamp and whenever scheduled
+    rebal_mask = _rebalance_mask(prices.index, rebalance)
+
+    equity, values = _simulate_kernel(px_kernel, rebal_mask, w_vec, float(initial_capital))
+
+    # equity is the per-row sum of values (accumulated in float64 by the kernel)
+    totals = equity[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        realized_w = np.where(totals > 0, values / totals, 0.0)
+        port_ret = np.zeros(len(equity))
+        port_ret[1:] = equity[1:] / equity[:-1] - 1.0
+    port_ret[np.isnan(port_ret)] = 0.0
+
+    # Assemble details from the dense blocks in a single allocation
+    details = pd.DataFrame(
+        np.hstack([px, realized_w, values, port_ret[:, None]]),
+        index=prices.index,
+        columns=[
+            *tickers,
+            *[f"w_{c}" for c in tickers],
+            *[f"val_{c}" for c in tickers],
+            "portfolio_return",
+        ],
+    )
+    equity = pd.Series(equity, index=prices.index, name="Portfolio Equity")
 
     return equity, details
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies import moving_average_crossover
+
+
+def _pandas_ma_crossover(prices, short_window, long_window, initial_capital=1000.0):
+    """
+    Reference: the original pandas implementation of the MA crossover.
+    """
+    df = pd.DataFrame({"price": prices})
+    df["ma_short"] = df["price"].rolling(short_window).mean()
+    df["ma_long"] = df["price"].rolling(long_window).mean()
+
+    df["signal"] = 0
+    df.loc[df["ma_short"] > df["ma_long"], "signal"] = 1
+    df.loc[df["ma_short"] < df["ma_long"], "signal"] = -1
+
+    df["position"] = df["signal"].shift(1).fillna(0)
+    df["returns"] = df["price"].pct_change().fillna(0.0)
+    df["strategy_returns"] = df["position"] * df["returns"]
+
+    equity_curve = (1 + df["strategy_returns"]).cumprod() * initial_capital
+    equity_curve.name = "MA Crossover"
+    return equity_curve, df
+
+
+def _random_prices(seed, n=500, flat=True):
+    rng = np.random.default_rng(seed)
+    x = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    if flat:
+        # stale closes: a run of identical prices longer than the windows
+        start = int(rng.integers(0, n - 150))
+        x[start:start + int(rng.integers(60, 150))] = x[start]
+    return pd.Series(x, index=pd.date_range("2020-01-01", periods=n, freq="D"))
+
+
+def _assert_matches_pandas(prices, short_window, long_window):
+    equity, details = moving_average_crossover(prices, short_window, long_window)
+    ref_equity, ref_details = _pandas_ma_crossover(prices, short_window, long_window)
+
+    np.testing.assert_array_equal(details["signal"].to_numpy(), ref_details["signal"].to_numpy())
+    pd.testing.assert_frame_equal(details, ref_details)
+    pd.testing.assert_series_equal(equity, ref_equity)
+
+
+def test_constant_segment_gives_flat_signal():
+    prices = pd.Series(
+        [100 + 0.37 * i for i in range(30)] + [111.13] * 60 + [112 + i for i in range(10)],
+        index=pd.date_range("2020-01-01", periods=100, freq="D"),
+    )
+    _assert_matches_pandas(prices, 20, 50)
+
+    # both windows inside the flat run (bars 79-89): averages are equal, so no signal
+    _, details = moving_average_crossover(prices, 20, 50)
+    assert (details["ma_short"].iloc[79:90] == 111.13).all()
+    assert (details["signal"].iloc[79:90] == 0).all()
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("windows", [(5, 20), (20, 50), (50, 200)])
+def test_matches_pandas_with_flat_stretches(seed, windows):
+    _assert_matches_pandas(_random_prices(seed), *windows)
+
+
+def test_matches_pandas_without_flat_stretches():
+    _assert_matches_pandas(_random_prices(123, flat=False), 20, 50)
+
+
+def test_windows_longer_than_series():
+    prices = _random_prices(0, n=30, flat=False)
+    equity, details = moving_average_crossover(prices, 40, 50)
+    assert details["ma_short"].isna().all()
+    assert (details["signal"] == 0).all()
+    assert equity.iloc[-1] == pytest.approx(1000.0)